@@ -41,6 +41,9 @@
 #define REG_VU_LEFT           0x20  // Left VU meter level (0-255) (R/W)
 #define REG_VU_RIGHT          0x21  // Right VU meter level (0-255) (R/W)
 #define REG_VU_MODE           0x22  // VU meter mode (R/W)
+#define REG_VU_SWEEP_START    0x23  // VU sweep start level (0-255) (R/W)
+#define REG_VU_SWEEP_END      0x24  // VU sweep end level (0-255) (R/W)
+#define REG_VU_SWEEP_STEP_MS  0x25  // VU sweep time per level step in ms (R/W)
 
 // --- Backlight Control ---
 #define REG_BACKLIGHT         0x30  // Backlight brightness (0-255) (R/W)
@@ -67,6 +70,7 @@
 #define REG_CONFIG_VU_FREQ    0x70  // VU meter PWM frequency (R/W)
 #define REG_CONFIG_DEBOUNCE   0x71  // Input debounce time (R/W)
 #define REG_CONFIG_OPTIONS    0x72  // Configuration options (R/W)
+#define REG_CONFIG_ENCODER_DIV 0x73 // Encoder quadrature steps per detent (R/W)
 
 // --- Command Register (Write-Only) ---
 #define REG_COMMAND           0xF0  // Command register (W)
@@ -144,6 +148,7 @@
 #define CMD_TEST_VU_LEFT      0x11  // Test left VU meter (sweep)
 #define CMD_TEST_VU_RIGHT     0x12  // Test right VU meter (sweep)
 #define CMD_TEST_VU_BOTH      0x13  // Test both VU meters
+#define CMD_VU_SWEEP          0x14  // Ramp both VU meters using REG_VU_SWEEP_*
 #define CMD_TEST_BACKLIGHT    0x20  // Test backlight (fade in/out)
 #define CMD_TEST_TAPE_MOTOR   0x30  // Test tape motor
 #define CMD_TEST_ALL          0xFF  // Test all outputs
@@ -183,7 +188,10 @@ typedef struct {
     uint8_t vu_left;                // 0x20
     uint8_t vu_right;               // 0x21
     uint8_t vu_mode;                // 0x22
-    uint8_t reserved_23[13];        // 0x23-0x2F
+    uint8_t vu_sweep_start;         // 0x23
+    uint8_t vu_sweep_end;           // 0x24
+    uint8_t vu_sweep_step_ms;       // 0x25
+    uint8_t reserved_26[10];        // 0x26-0x2F
 
     // Backlight
     uint8_t backlight;              // 0x30
@@ -214,7 +222,8 @@ typedef struct {
     uint8_t config_vu_freq;         // 0x70
     uint8_t config_debounce;        // 0x71
     uint8_t config_options;         // 0x72
-    uint8_t reserved_73[13];        // 0x73-0x7F
+    uint8_t config_encoder_div;     // 0x73
+    uint8_t reserved_74[12];        // 0x74-0x7F
 } __attribute__((packed)) I2CRegisterBank;
 
 // ============================================================================
@@ -22,6 +22,7 @@
 #define PIN_I2C_SDA           2    // I2C1 SDA - Connect to RPi Zero 2 GPIO2 (SDA)
 #define PIN_I2C_SCL           3    // I2C1 SCL - Connect to RPi Zero 2 GPIO3 (SCL)
 #define I2C_SLAVE_ADDRESS     0x42 // 7-bit I2C slave address
+#define PIN_HOST_INT          28   // Event interrupt to RPi (active low, open drain)
 
 // ============================================================================
 // VU METERS - PWM OUTPUTS (DRV8833 Motor Drivers)
@@ -67,6 +68,7 @@
 
 // Encoder Configuration
 #define ENCODER_DEBOUNCE_MS   5    // Debounce time in milliseconds
+#define ENCODER_STEPS_PER_DETENT 4 // Quadrature steps per detent (EC11 style)
 
 // ============================================================================
 // DIGITAL INPUTS (12 channels)
@@ -101,7 +103,7 @@ const uint8_t DIGITAL_INPUT_PINS[NUM_DIGITAL_INPUTS] = {
 // GP23: Used by RP2040 for SMPS mode (on Pico board)
 // GP24: Not available on Pico board
 // GP25: Onboard LED (Pico board)
-// GP28-29: ADC inputs, can be repurposed if needed
+// GP29: ADC input, can be repurposed if needed
 
 // ============================================================================
 // STATUS LED (Optional - uses onboard LED)
@@ -40,12 +40,23 @@ uint8_t input_prev_high = 0x0F;
 uint32_t input_last_change[NUM_DIGITAL_INPUTS] = {0};
 
 // Encoder state tracking
-volatile int16_t encoder_position = 0;
-volatile int8_t encoder_delta = 0;
+volatile int16_t encoder_steps = 0;   // Quadrature steps not yet counted as detents
+volatile int16_t encoder_position = 0; // Position in detents
 volatile uint8_t encoder_state = 0;
 uint8_t encoder_button_state = ENC_BTN_RELEASED;
 uint32_t encoder_button_press_time = 0;
 uint32_t encoder_button_last_release = 0;
+volatile bool button_event = false;   // Button state changed since last read
+
+// Host interrupt line state
+bool host_int_asserted = false;
+
+// VU sweep state (CMD_VU_SWEEP), stepped from the main loop
+volatile bool vu_sweep_active = false;
+int16_t vu_sweep_level = 0;
+int16_t vu_sweep_target = 0;
+uint8_t vu_sweep_step_ms = 0;
+uint32_t vu_sweep_last_step = 0;
 
 // PWM slices for each output
 uint slice_vu_left, slice_vu_right;
@@ -66,6 +77,8 @@ void setup_i2c(void);
 void update_inputs(void);
 void update_encoder(void);
 void update_pwm_outputs(void);
+void update_vu_sweep(uint32_t now);
+void update_host_int(void);
 void i2c_receive_handler(int byte_count);
 void i2c_request_handler(void);
 void set_motor_pwm(uint slice, uint8_t channel_a, uint8_t channel_b, uint8_t level);
@@ -105,6 +118,9 @@ void loop() {
     static uint32_t last_update = 0;
     uint32_t now = millis();
 
+    // Step any running VU sweep at its own rate
+    update_vu_sweep(now);
+
     // Update at 100Hz
     if (now - last_update >= 10) {
         last_update = now;
@@ -118,6 +134,12 @@ void loop() {
         // Update PWM outputs from register values
         update_pwm_outputs();
 
+        // Signal the host if there are unread events. The I2C IRQ also
+        // calls this, so keep it from interleaving with the loop-side update
+        noInterrupts();
+        update_host_int();
+        interrupts();
+
         // Blink status LED
         if (now - led_last_blink >= 500) {
             led_last_blink = now;
@@ -153,6 +175,9 @@ void setup_gpio() {
     attachInterrupt(digitalPinToInterrupt(PIN_ENCODER_A), encoder_isr, CHANGE);
     attachInterrupt(digitalPinToInterrupt(PIN_ENCODER_B), encoder_isr, CHANGE);
 
+    // Host interrupt line, released (high-Z) until there is an event
+    pinMode(PIN_HOST_INT, INPUT);
+
     Serial.println("GPIO configured");
 }
 
@@ -317,24 +342,94 @@ void update_inputs() {
         registers.status &= ~STATUS_BUTTON_PRESSED;
     }
 
+    if (registers.encoder_button != encoder_button_state) {
+        button_event = true;
+    }
     registers.encoder_button = encoder_button_state;
 }
 
 void update_encoder() {
-    // Update encoder position in registers
+    uint8_t divisor = registers.config_encoder_div ? registers.config_encoder_div : 1;
+
+    // Convert whole detents from the ISR step count, keeping any remainder
     noInterrupts();
-    int16_t pos = encoder_position;
-    int8_t delta = encoder_delta;
-    encoder_delta = 0;  // Clear delta after reading
+    int16_t detents = encoder_steps / divisor;
+    encoder_steps -= detents * divisor;
     interrupts();
 
-    registers.encoder_pos_low = pos & 0xFF;
-    registers.encoder_pos_high = (pos >> 8) & 0xFF;
-    registers.encoder_delta = delta;
+    // Position and delta are shared with CTRL_RESET_ENCODER and register
+    // reads in the I2C handlers, so update them with interrupts off
+    noInterrupts();
+    if (detents != 0) {
+        encoder_position += detents;
 
-    if (delta != 0) {
+        // Accumulate delta until read (saturating), so no detents are lost
+        // between host polls
+        int16_t delta = registers.encoder_delta + detents;
+        registers.encoder_delta = constrain(delta, -128, 127);
         registers.status |= STATUS_ENCODER_CHANGED;
     }
+
+    // Update encoder position in registers
+    registers.encoder_pos_low = encoder_position & 0xFF;
+    registers.encoder_pos_high = (encoder_position >> 8) & 0xFF;
+    interrupts();
+}
+
+void update_vu_sweep(uint32_t now) {
+    if (!vu_sweep_active) return;
+
+    // The I2C IRQ cancels sweeps (direct VU writes) and restarts them
+    // (CMD_VU_SWEEP), so re-check and step the sweep with interrupts off
+    noInterrupts();
+    if (!vu_sweep_active) {
+        interrupts();
+        return;
+    }
+
+    // Advance one level per elapsed step period, so loop jitter does not
+    // stretch the sweep. A sweep restarted after now was sampled has not
+    // had a step period yet.
+    int32_t elapsed = (int32_t)(now - vu_sweep_last_step);
+    int16_t steps = elapsed < 0 ? 0 :
+                    vu_sweep_step_ms ? min(elapsed / vu_sweep_step_ms, (int32_t)256) : 256;
+    if (steps == 0) {
+        interrupts();
+        return;
+    }
+    vu_sweep_last_step += steps * vu_sweep_step_ms;
+
+    if (vu_sweep_level < vu_sweep_target) {
+        vu_sweep_level = min((int16_t)(vu_sweep_level + steps), vu_sweep_target);
+    } else {
+        vu_sweep_level = max((int16_t)(vu_sweep_level - steps), vu_sweep_target);
+    }
+
+    registers.vu_left = vu_sweep_level;
+    registers.vu_right = vu_sweep_level;
+
+    if (vu_sweep_level == vu_sweep_target) {
+        vu_sweep_active = false;
+    }
+    interrupts();
+}
+
+void update_host_int() {
+    // Asserted while any input change, encoder movement or button state
+    // change has not yet been read by the host
+    bool pending = (registers.status & (STATUS_INPUT_CHANGED | STATUS_ENCODER_CHANGED)) ||
+                   button_event;
+
+    if (pending == host_int_asserted) return;
+    host_int_asserted = pending;
+
+    // Emulate open drain: drive low to assert, float to release
+    if (pending) {
+        digitalWrite(PIN_HOST_INT, LOW);
+        pinMode(PIN_HOST_INT, OUTPUT);
+    } else {
+        pinMode(PIN_HOST_INT, INPUT);
+    }
 }
 
 void update_pwm_outputs() {
@@ -453,8 +548,7 @@ void encoder_isr() {
     encoder_state = new_state;
 
     if (delta != 0) {
-        encoder_position += delta;
-        encoder_delta += delta;
+        encoder_steps += delta;
     }
 }
 
@@ -475,6 +569,8 @@ void i2c_registers_init() {
     registers.control = CTRL_ENABLE;
     registers.status = STATUS_READY;
     registers.vu_mode = VU_MODE_NORMAL;
+    registers.vu_sweep_end = 255;
+    registers.vu_sweep_step_ms = 10;
     registers.backlight = 128;
     registers.backlight_mode = BACKLIGHT_MODE_MANUAL;
     registers.tape_direction = TAPE_DIR_STOP;
@@ -483,6 +579,7 @@ void i2c_registers_init() {
     registers.input_status_high = 0x0F;
     registers.config_vu_freq = 1;
     registers.config_debounce = INPUT_DEBOUNCE_MS;
+    registers.config_encoder_div = ENCODER_STEPS_PER_DETENT;
 }
 
 uint8_t i2c_register_read(uint8_t reg_addr) {
@@ -508,7 +605,12 @@ uint8_t i2c_register_read(uint8_t reg_addr) {
             registers.status &= ~STATUS_INPUT_CHANGED;
         }
     } else if (reg_addr == REG_ENCODER_DELTA) {
+        registers.encoder_delta = 0;
         registers.status &= ~STATUS_ENCODER_CHANGED;
+    } else if (reg_addr == REG_ENCODER_BUTTON) {
+        button_event = false;
+        // Release the host interrupt as soon as the last event is read
+        update_host_int();
     }
 
     return value;
@@ -536,12 +638,17 @@ bool i2c_register_write(uint8_t reg_addr, uint8_t value) {
     uint8_t *reg_ptr = (uint8_t*)&registers;
     reg_ptr[reg_addr] = value;
 
+    // A direct VU level write overrides any running sweep
+    if (reg_addr == REG_VU_LEFT || reg_addr == REG_VU_RIGHT) {
+        vu_sweep_active = false;
+    }
+
     // Handle special control register operations
     if (reg_addr == REG_CONTROL) {
         if (value & CTRL_RESET_ENCODER) {
             noInterrupts();
+            encoder_steps = 0;
             encoder_position = 0;
-            encoder_delta = 0;
             interrupts();
             registers.encoder_pos_low = 0;
             registers.encoder_pos_high = 0;
@@ -568,9 +675,22 @@ bool i2c_execute_command(uint8_t command) {
 
         case CMD_RESET:
             // Soft reset
+            vu_sweep_active = false;
+            button_event = false;
             i2c_registers_init();
             break;
 
+        case CMD_VU_SWEEP:
+            // Start at the first level now; the main loop steps the rest
+            vu_sweep_level = registers.vu_sweep_start;
+            vu_sweep_target = registers.vu_sweep_end;
+            vu_sweep_step_ms = registers.vu_sweep_step_ms;
+            vu_sweep_last_step = millis();
+            registers.vu_left = vu_sweep_level;
+            registers.vu_right = vu_sweep_level;
+            vu_sweep_active = (vu_sweep_level != vu_sweep_target);
+            break;
+
         case CMD_TEST_VU_LEFT:
         case CMD_TEST_VU_RIGHT:
         case CMD_TEST_VU_BOTH:
@@ -9,17 +9,29 @@ Features:
 - Monitor 12 digital inputs (buttons/switches)
 - Monitor rotary encoder for volume control
 - Monitor encoder button
-- Execute commands via pcp (PiCorePlayer command-line tools)
+- Wait on the controller's INT line instead of polling, if wired
+- Send playback commands over a persistent LMS CLI connection (or pcp)
 """
 
 import sys
 import time
 import signal
 import logging
+import select
+import shutil
+import socket
 import argparse
+import ipaddress
 import subprocess
+from functools import partial
 from pathlib import Path
-from typing import Optional, Callable, Dict
+from typing import Optional, Callable, Dict, List
+from urllib.parse import quote, unquote
+
+try:
+    import alsaaudio
+except ImportError:
+    alsaaudio = None
 
 try:
     from rp2040_controller import RP2040Controller
@@ -39,16 +51,300 @@ class SqueezeliteControl:
     """
     Control interface for Squeezelite/LMS (Logitech Media Server).
 
-    Uses pcp (PiCorePlayer) command-line tools to control playback.
+    Sends playback commands over a persistent connection to the LMS CLI
+    port, or through pcp (PiCorePlayer) command-line tools when no LMS CLI
+    answers the handshake at startup. Volume is set through the ALSA mixer API
+    when pyalsaaudio is installed, otherwise through amixer.
     """
 
+    # LMS CLI connection
+    LMS_HOST = "localhost"
+    LMS_PORT = 9090
+    LMS_TIMEOUT = 5.0
+
+    # Minimum time between attempts to find a backend after none was
+    # available, e.g. while LMS is still starting at boot (seconds)
+    BACKEND_RETRY_INTERVAL = 10.0
+
+    # ALSA mixer control used for volume
+    MIXER_CONTROL = "Digital"
+
+    def __init__(self, host: str = LMS_HOST, port: int = LMS_PORT,
+                 player_id: Optional[str] = None):
+        """
+        Initialize Squeezelite control.
+
+        Args:
+            host: LMS host name (default: localhost)
+            port: LMS CLI port (default: 9090)
+            player_id: Player MAC address to control (default: the one
+                player LMS sees connecting from this host)
+        """
+        self.host = host
+        self.port = port
+        self.player_id = player_id
+        self._lms_sock = None
+        self._lms_player = None
+        self._mixer = None
+        self._backend = None
+        self._next_backend_retry = 0.0
+
+    def connect(self) -> bool:
+        """
+        Open the persistent LMS CLI connection.
+
+        The connection is only kept if the server answers a CLI version
+        query and the player to control is confirmed: player_id if given
+        (it must be connected), otherwise the single player connected
+        from this host's address.
+
+        Returns:
+            True if connected, False otherwise
+        """
+        self.close()
+        try:
+            sock = socket.create_connection((self.host, self.port), timeout=self.LMS_TIMEOUT)
+        except OSError as e:
+            logger.warning("Could not connect to LMS CLI at %s:%d: %s", self.host, self.port, e)
+            return False
+
+        try:
+            version = self._query_value(sock, "version ?")
+
+            if self.player_id:
+                player = quote(self.player_id, safe="")
+                if self._query_value(sock, "%s connected ?" % player) != "1":
+                    raise OSError("player %s not connected" % self.player_id)
+            else:
+                player = quote(self._find_local_player(sock), safe="")
+        except (OSError, ValueError) as e:
+            logger.warning("LMS CLI at %s:%d unusable: %s", self.host, self.port, e)
+            sock.close()
+            return False
+
+        self._lms_sock = sock
+        self._lms_player = player
+        logger.info("Connected to LMS CLI at %s:%d (version %s, player %s)",
+                    self.host, self.port, version, unquote(player))
+        return True
+
+    @classmethod
+    def _find_local_player(cls, sock: socket.socket) -> str:
+        """
+        Find the player connected to LMS from this host.
+
+        A local squeezelite reaches LMS from the same address as the CLI
+        connection, so match player addresses against that.
+
+        Args:
+            sock: Connected CLI socket
+
+        Returns:
+            Player id (MAC address)
+
+        Raises:
+            OSError: If no single local player can be confirmed
+        """
+        local = cls._parse_addr(sock.getsockname()[0])
+        matches = []
+        for index in range(int(cls._query_value(sock, "player count ?"))):
+            addr = cls._query_value(sock, "player ip %d ?" % index).rsplit(":", 1)[0]
+            peer = cls._parse_addr(addr)
+            if peer == local or (peer.is_loopback and local.is_loopback):
+                matches.append(cls._query_value(sock, "player id %d ?" % index))
+
+        if len(matches) != 1:
+            raise OSError("%d players connected from %s, use --player-id"
+                          % (len(matches), local))
+        return matches[0]
+
+    @staticmethod
+    def _parse_addr(addr: str):
+        """Parse an IP address, unwrapping IPv4-mapped IPv6 addresses."""
+        ip = ipaddress.ip_address(addr.strip("[]"))
+        return getattr(ip, "ipv4_mapped", None) or ip
+
+    @classmethod
+    def _query_value(cls, sock: socket.socket, request: str) -> str:
+        """
+        Send a CLI query and return the answer in place of its "?".
+
+        Args:
+            sock: Connected CLI socket (with a timeout)
+            request: CLI query ending in "?"
+
+        Returns:
+            Decoded answer
+
+        Raises:
+            OSError: If the reply does not answer the query
+        """
+        prefix = request[:-1]
+        reply = cls._query(sock, request)
+        value = unquote(reply[len(prefix):])
+        if not reply.startswith(prefix) or value in ("", "?"):
+            raise OSError("no answer to %r: %r" % (request, reply))
+        return value
+
     @staticmethod
-    def execute_command(command: str) -> bool:
+    def _query(sock: socket.socket, request: str) -> str:
+        """
+        Send a CLI query and read its one-line reply.
+
+        Args:
+            sock: Connected CLI socket (with a timeout)
+            request: CLI query (without trailing newline)
+
+        Returns:
+            Reply line without the trailing newline
+        """
+        sock.sendall(request.encode() + b"\n")
+        reply = b""
+        while not reply.endswith(b"\n"):
+            data = sock.recv(4096)
+            if not data:
+                raise OSError("connection closed")
+            reply += data
+        return reply.decode(errors="replace").strip()
+
+    def select_backend(self) -> Optional[str]:
+        """
+        Choose how playback commands are sent.
+
+        Called at startup, and again from playback_command() while no
+        backend is available.
+
+        The LMS CLI is only chosen once it has answered the version and
+        player queries; a port that merely accepts connections (such as
+        SlimProto on a local LMS) leaves pcp in charge.
+
+        Returns:
+            "sock" for the LMS CLI connection, "pcp" for pcp command-line
+            tools, or None if neither is available
+        """
+        if self.connect():
+            self._backend = "sock"
+        elif shutil.which("pcp"):
+            self._backend = "pcp"
+        else:
+            self._backend = None
+            self._next_backend_retry = time.monotonic() + self.BACKEND_RETRY_INTERVAL
+            logger.error("No playback control available (no usable LMS CLI, pcp not found)")
+            return None
+
+        logger.info("Playback commands via %s", self._backend)
+        return self._backend
+
+    def close(self):
+        """Close the LMS CLI connection."""
+        if self._lms_sock:
+            self._lms_sock.close()
+            self._lms_sock = None
+            self._lms_player = None
+
+    def open_mixer(self) -> bool:
+        """
+        Open the ALSA mixer control used for volume.
+
+        Returns:
+            True if opened, False if volume falls back to amixer
+        """
+        if alsaaudio is None:
+            logger.info("pyalsaaudio not installed, using amixer for volume")
+            return False
+        try:
+            self._mixer = alsaaudio.Mixer(self.MIXER_CONTROL)
+            return True
+        except alsaaudio.ALSAAudioError as e:
+            logger.warning("Could not open mixer '%s', using amixer: %s", self.MIXER_CONTROL, e)
+            return False
+
+    def _get_vol(self) -> int:
+        """Read the current mixer volume (0-100)."""
+        return self._mixer.getvolume()[0]
+
+    def _set_vol(self, level: int):
+        """Set the mixer volume, clamped to 0-100."""
+        self._mixer.setvolume(max(0, min(100, level)))
+
+    def _drain_replies(self) -> bool:
         """
-        Execute a shell command.
+        Discard replies to earlier commands without blocking.
+
+        Returns:
+            False if the server has closed the connection
+        """
+        sock = self._lms_sock
+        while select.select([sock], [], [], 0)[0]:
+            if not sock.recv(4096):
+                return False
+        return True
+
+    def send_cli(self, command: str) -> bool:
+        """
+        Send a player command over the LMS CLI connection.
+
+        Reconnects first if the connection has dropped. A command is sent
+        at most once; if sending fails it is not retried.
 
         Args:
-            command: Command to execute
+            command: CLI player command (without player id or newline)
+
+        Returns:
+            True if sent, False otherwise
+        """
+        try:
+            if self._lms_sock is not None and not self._drain_replies():
+                logger.warning("LMS CLI connection closed by server")
+                self.close()
+        except OSError as e:
+            logger.warning("LMS CLI connection lost: %s", e)
+            self.close()
+
+        if self._lms_sock is None and not self.connect():
+            return False
+
+        try:
+            self._lms_sock.sendall(
+                ("%s %s\n" % (self._lms_player, command)).encode())
+            return True
+        except OSError as e:
+            logger.warning("LMS CLI send failed: %s", e)
+            self.close()
+            return False
+
+    def playback_command(self, pcp_command: str, cli_command: str) -> bool:
+        """
+        Send a playback command through the selected backend.
+
+        If no backend was available, selection is retried at most once
+        per BACKEND_RETRY_INTERVAL; commands sent meanwhile are dropped.
+
+        Args:
+            pcp_command: pcp subcommand (e.g. "play")
+            cli_command: Equivalent LMS CLI command
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self._backend is None:
+            if time.monotonic() >= self._next_backend_retry:
+                self.select_backend()
+            if self._backend is None:
+                logger.warning("No playback control, dropped command: %s", cli_command)
+                return False
+
+        if self._backend == "sock":
+            return self.send_cli(cli_command)
+        return self.execute_command(["pcp", pcp_command])
+
+    @staticmethod
+    def execute_command(command: List[str]) -> bool:
+        """
+        Execute a command directly (no shell).
+
+        Args:
+            command: Program and arguments to execute
 
         Returns:
             True if successful, False otherwise
@@ -56,97 +352,109 @@ class SqueezeliteControl:
         try:
             result = subprocess.run(
                 command,
-                shell=True,
                 capture_output=True,
                 text=True,
                 timeout=5
             )
             if result.returncode != 0:
-                logger.error(f"Command failed: {command}\n{result.stderr}")
+                logger.error("Command failed: %s\n%s", " ".join(command), result.stderr)
                 return False
             return True
         except subprocess.TimeoutExpired:
-            logger.error(f"Command timed out: {command}")
+            logger.error("Command timed out: %s", " ".join(command))
             return False
         except Exception as e:
-            logger.error(f"Error executing command: {e}")
+            logger.error("Error executing command: %s", e)
             return False
 
-    @staticmethod
-    def play_pause():
+    def play_pause(self):
         """Toggle play/pause."""
-        logger.info("Play/Pause")
-        # Use pcp command or direct squeezelite control
-        SqueezeliteControl.execute_command("pcp play_pause || echo 'pause' | nc localhost 3483")
+        logger.debug("Play/Pause")
+        self.playback_command("play_pause", "pause")
 
-    @staticmethod
-    def play():
+    def play(self):
         """Start playback."""
-        logger.info("Play")
-        SqueezeliteControl.execute_command("pcp play || echo 'play' | nc localhost 3483")
+        logger.debug("Play")
+        self.playback_command("play", "play")
 
-    @staticmethod
-    def pause():
+    def pause(self):
         """Pause playback."""
-        logger.info("Pause")
-        SqueezeliteControl.execute_command("pcp pause || echo 'pause' | nc localhost 3483")
+        logger.debug("Pause")
+        self.playback_command("pause", "pause")
 
-    @staticmethod
-    def stop():
+    def stop(self):
         """Stop playback."""
-        logger.info("Stop")
-        SqueezeliteControl.execute_command("pcp stop || echo 'stop' | nc localhost 3483")
+        logger.debug("Stop")
+        self.playback_command("stop", "stop")
 
-    @staticmethod
-    def next_track():
+    def next_track(self):
         """Skip to next track."""
-        logger.info("Next Track")
-        SqueezeliteControl.execute_command("pcp next || echo 'button jump_fwd' | nc localhost 3483")
+        logger.debug("Next Track")
+        self.playback_command("next", "button jump_fwd")
 
-    @staticmethod
-    def previous_track():
+    def previous_track(self):
         """Go to previous track."""
-        logger.info("Previous Track")
-        SqueezeliteControl.execute_command("pcp previous || echo 'button jump_rew' | nc localhost 3483")
+        logger.debug("Previous Track")
+        self.playback_command("previous", "button jump_rew")
 
-    @staticmethod
-    def volume_up(amount: int = 5):
+    def volume_up(self, amount: int = 5):
         """
         Increase volume.
 
         Args:
             amount: Volume increase amount (0-100)
         """
-        logger.info(f"Volume Up (+{amount})")
-        SqueezeliteControl.execute_command(f"amixer sset 'Digital' {amount}%+")
-
-    @staticmethod
-    def volume_down(amount: int = 5):
+        logger.debug("Volume Up (+%d)", amount)
+        if self._mixer:
+            try:
+                self._set_vol(self._get_vol() + amount)
+                return
+            except alsaaudio.ALSAAudioError as e:
+                logger.error("Mixer error: %s", e)
+        self.execute_command(["amixer", "sset", self.MIXER_CONTROL, f"{amount}%+"])
+
+    def volume_down(self, amount: int = 5):
         """
         Decrease volume.
 
         Args:
             amount: Volume decrease amount (0-100)
         """
-        logger.info(f"Volume Down (-{amount})")
-        SqueezeliteControl.execute_command(f"amixer sset 'Digital' {amount}%-")
-
-    @staticmethod
-    def set_volume(level: int):
+        logger.debug("Volume Down (-%d)", amount)
+        if self._mixer:
+            try:
+                self._set_vol(self._get_vol() - amount)
+                return
+            except alsaaudio.ALSAAudioError as e:
+                logger.error("Mixer error: %s", e)
+        self.execute_command(["amixer", "sset", self.MIXER_CONTROL, f"{amount}%-"])
+
+    def set_volume(self, level: int):
         """
         Set absolute volume level.
 
         Args:
             level: Volume level (0-100)
         """
-        logger.info(f"Set Volume: {level}")
-        SqueezeliteControl.execute_command(f"amixer sset 'Digital' {level}%")
-
-    @staticmethod
-    def mute_toggle():
+        logger.debug("Set Volume: %d", level)
+        if self._mixer:
+            try:
+                self._set_vol(level)
+                return
+            except alsaaudio.ALSAAudioError as e:
+                logger.error("Mixer error: %s", e)
+        self.execute_command(["amixer", "sset", self.MIXER_CONTROL, f"{level}%"])
+
+    def mute_toggle(self):
         """Toggle mute."""
-        logger.info("Mute Toggle")
-        SqueezeliteControl.execute_command("amixer sset 'Digital' toggle")
+        logger.debug("Mute Toggle")
+        if self._mixer:
+            try:
+                self._mixer.setmute(0 if self._mixer.getmute()[0] else 1)
+                return
+            except alsaaudio.ALSAAudioError as e:
+                logger.error("Mixer error: %s", e)
+        self.execute_command(["amixer", "sset", self.MIXER_CONTROL, "toggle"])
 
 
 class InputHandler:
@@ -154,37 +462,72 @@ class InputHandler:
     Input handler for digital inputs and rotary encoder.
     """
 
-    # Default input mappings
-    DEFAULT_INPUT_MAP = {
-        1: ("Play/Pause", SqueezeliteControl.play_pause),
-        2: ("Stop", SqueezeliteControl.stop),
-        3: ("Next Track", SqueezeliteControl.next_track),
-        4: ("Previous Track", SqueezeliteControl.previous_track),
-        5: ("Volume Up", lambda: SqueezeliteControl.volume_up(5)),
-        6: ("Volume Down", lambda: SqueezeliteControl.volume_down(5)),
-        7: ("Mute", SqueezeliteControl.mute_toggle),
-        8: ("Input 8", lambda: logger.info("Input 8 pressed")),
-        9: ("Input 9", lambda: logger.info("Input 9 pressed")),
-        10: ("Input 10", lambda: logger.info("Input 10 pressed")),
-        11: ("Input 11", lambda: logger.info("Input 11 pressed")),
-        12: ("Input 12", lambda: logger.info("Input 12 pressed")),
-    }
-
-    def __init__(self, controller: RP2040Controller):
+    # Default input mappings (index 0 = input 1); each action is called
+    # with the handler's SqueezeliteControl instance
+    DEFAULT_INPUT_MAP = [
+        ("Play/Pause", SqueezeliteControl.play_pause),
+        ("Stop", SqueezeliteControl.stop),
+        ("Next Track", SqueezeliteControl.next_track),
+        ("Previous Track", SqueezeliteControl.previous_track),
+        ("Volume Up", lambda sc: sc.volume_up(5)),
+        ("Volume Down", lambda sc: sc.volume_down(5)),
+        ("Mute", SqueezeliteControl.mute_toggle),
+        ("Input 8", lambda sc: logger.info("Input 8 pressed")),
+        ("Input 9", lambda sc: logger.info("Input 9 pressed")),
+        ("Input 10", lambda sc: logger.info("Input 10 pressed")),
+        ("Input 11", lambda sc: logger.info("Input 11 pressed")),
+        ("Input 12", lambda sc: logger.info("Input 12 pressed")),
+    ]
+
+    # Minimum time between mixer updates for encoder volume changes (seconds)
+    VOLUME_FLUSH_INTERVAL = 0.1
+
+    # Longest wait for an INT line event when nothing is pending (seconds)
+    EVENT_WAIT_TIMEOUT = 1.0
+
+    # Encoder mode names, indexed by encoder_volume_mode
+    ENCODER_MODE_NAMES = ("Track Selection", "Volume")
+
+    def __init__(self, controller: RP2040Controller,
+                 lms_host: str = SqueezeliteControl.LMS_HOST,
+                 player_id: Optional[str] = None):
         """
         Initialize input handler.
 
         Args:
             controller: RP2040Controller instance
+            lms_host: LMS host name (default: localhost)
+            player_id: Player MAC address to control (default: the local
+                player)
         """
         self.controller = controller
-        self.input_map = self.DEFAULT_INPUT_MAP.copy()
         self.running = False
 
+        # Playback control over a persistent LMS connection
+        self.squeezelite = SqueezeliteControl(host=lms_host, player_id=player_id)
+        self.squeezelite.select_backend()
+        self.squeezelite.open_mixer()
+
+        self.input_map = [(name, partial(action, self.squeezelite))
+                          for name, action in self.DEFAULT_INPUT_MAP]
+
+        # Button codes and actions used on every poll, bound once
+        self._btn_pressed = RP2040Controller.ENC_BTN_PRESSED
+        self._btn_held = RP2040Controller.ENC_BTN_HELD
+        self._btn_double_click = RP2040Controller.ENC_BTN_DOUBLE_CLICK
+        self._play_pause = self.squeezelite.play_pause
+        self._mute_toggle = self.squeezelite.mute_toggle
+        self._volume_up = self.squeezelite.volume_up
+        self._volume_down = self.squeezelite.volume_down
+
         # Encoder state
         self.last_encoder_pos = 0
         self.encoder_volume_mode = True  # True = volume control, False = track selection
 
+        # Encoder volume change not yet applied to the mixer
+        self._pending_delta = 0
+        self._last_vol_flush = 0.0
+
     def set_input_action(self, input_num: int, name: str, action: Callable):
         """
         Set action for a specific input.
@@ -192,94 +535,163 @@ class InputHandler:
         Args:
             input_num: Input number (1-12)
             name: Descriptive name for the action
-            action: Callable to execute when input is pressed
+            action: Callable to execute when input is pressed; like the
+                DEFAULT_INPUT_MAP entries, it is called with the handler's
+                SqueezeliteControl instance (e.g. lambda sc: sc.volume_up(10))
         """
         if 1 <= input_num <= 12:
-            self.input_map[input_num] = (name, action)
-            logger.info(f"Input {input_num} mapped to: {name}")
-
-    def handle_digital_inputs(self):
-        """Check and handle digital input changes."""
-        # Get inputs that have changed
-        changes = self.controller.get_input_changes()
-
-        # Get current input states
-        inputs = self.controller.get_digital_inputs()
-
-        # Process changed inputs
-        for i, changed in enumerate(changes, 1):
-            if changed and inputs[i - 1]:  # Input is pressed and changed
-                if i in self.input_map:
-                    name, action = self.input_map[i]
-                    logger.info(f"Input {i} ({name}) pressed")
-                    try:
-                        action()
-                    except Exception as e:
-                        logger.error(f"Error executing action for input {i}: {e}")
-
-    def handle_encoder(self):
-        """Handle rotary encoder rotation and button."""
-        # Get encoder delta
-        delta = self.controller.get_encoder_delta()
+            self.input_map[input_num - 1] = (name, partial(action, self.squeezelite))
+            logger.info("Input %d mapped to: %s", input_num, name)
+
+    def poll_inputs(self):
+        """Read one input snapshot and handle digital inputs and encoder."""
+        changes, inputs, delta, button = self.controller.get_input_snapshot()
+
+        # Handle digital inputs that have changed and are now pressed
+        self.handle_digital_inputs(changes & inputs)
+
+        # Handle encoder
+        self.handle_encoder(delta, button)
 
+    def handle_digital_inputs(self, edges: int):
+        """
+        Handle newly pressed digital inputs.
+
+        Args:
+            edges: 12-bit mask of inputs that changed and are now pressed
+        """
+        # Visit only the set bits, lowest input first
+        while edges:
+            bit = edges & -edges
+            edges ^= bit
+            index = bit.bit_length() - 1
+
+            name, action = self.input_map[index]
+            logger.debug("Input %d (%s) pressed", index + 1, name)
+            try:
+                action()
+            except Exception as e:
+                logger.error("Error executing action for input %d: %s", index + 1, e)
+
+    def handle_encoder(self, delta: int, button: int):
+        """
+        Handle rotary encoder rotation and button.
+
+        Args:
+            delta: Encoder detents turned since last read
+            button: Encoder button state (ENC_BTN_*)
+        """
         if delta != 0:
             if self.encoder_volume_mode:
-                # Volume control mode
-                if delta > 0:
-                    SqueezeliteControl.volume_up(abs(delta))
-                else:
-                    SqueezeliteControl.volume_down(abs(delta))
+                # Volume control mode: accumulate, applying at once on reversal
+                if self._pending_delta * delta < 0:
+                    self.flush_volume()
+                self._pending_delta += delta
             else:
                 # Track selection mode (not implemented)
-                logger.info(f"Encoder delta: {delta}")
-
-        # Handle encoder button
-        button = self.controller.get_encoder_button()
-
-        if button == RP2040Controller.ENC_BTN_PRESSED:
-            logger.info("Encoder button pressed")
-            SqueezeliteControl.play_pause()
-        elif button == RP2040Controller.ENC_BTN_HELD:
-            logger.info("Encoder button held")
+                logger.debug("Encoder delta: %d", delta)
+
+        # Handle encoder button (ENC_BTN_RELEASED is the common case)
+        if not button:
+            return
+        if button == self._btn_pressed:
+            logger.debug("Encoder button pressed")
+            self._play_pause()
+        elif button == self._btn_held:
+            logger.debug("Encoder button held")
             # Toggle encoder mode
+            self.flush_volume()
             self.encoder_volume_mode = not self.encoder_volume_mode
-            mode_str = "Volume" if self.encoder_volume_mode else "Track Selection"
-            logger.info(f"Encoder mode: {mode_str}")
-        elif button == RP2040Controller.ENC_BTN_DOUBLE_CLICK:
-            logger.info("Encoder button double-clicked")
-            SqueezeliteControl.mute_toggle()
+            logger.info("Encoder mode: %s",
+                        self.ENCODER_MODE_NAMES[self.encoder_volume_mode])
+        elif button == self._btn_double_click:
+            logger.debug("Encoder button double-clicked")
+            self._mute_toggle()
+
+    def flush_volume(self):
+        """Apply accumulated encoder volume change with a single mixer call."""
+        delta = self._pending_delta
+        if delta == 0:
+            return
+
+        self._pending_delta = 0
+        self._last_vol_flush = time.monotonic()
+
+        if delta > 0:
+            self._volume_up(delta)
+        else:
+            self._volume_down(-delta)
+
+    def flush_volume_if_due(self):
+        """Apply accumulated volume changes, at most once per flush interval."""
+        if (self._pending_delta and
+                time.monotonic() - self._last_vol_flush >= self.VOLUME_FLUSH_INTERVAL):
+            self.flush_volume()
+
+    def run_polled(self, poll_rate: int):
+        """
+        Poll the controller at a fixed rate.
+
+        Args:
+            poll_rate: Polling rate in Hz
+        """
+        poll_interval = 1.0 / poll_rate
+        next_tick = time.monotonic() + poll_interval
+
+        while self.running:
+            # Handle digital inputs and encoder from one snapshot
+            self.poll_inputs()
+
+            self.flush_volume_if_due()
+
+            # Sleep until the next scheduled tick to maintain poll rate
+            sleep_time = next_tick - time.monotonic()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+                next_tick += poll_interval
+            elif sleep_time < -poll_interval:
+                # Fell behind by more than a tick: resync, don't burst
+                next_tick = time.monotonic() + poll_interval
+            else:
+                next_tick += poll_interval
+
+    def run_events(self):
+        """Read the controller only when it signals an event on the INT line."""
+        while self.running:
+            # Wake in time to flush pending volume changes
+            timeout = (self.VOLUME_FLUSH_INTERVAL if self._pending_delta
+                       else self.EVENT_WAIT_TIMEOUT)
+            state = self.controller.wait_for_event(timeout)
+            if state is not None:
+                self.handle_digital_inputs(state.changes & state.inputs)
+                self.handle_encoder(state.encoder_delta, state.encoder_button)
+
+            self.flush_volume_if_due()
 
     def run(self, poll_rate: int = 20):
         """
         Run the input handler main loop.
 
+        Waits on the controller's INT line if one is configured, otherwise
+        polls at poll_rate.
+
         Args:
             poll_rate: Polling rate in Hz (default: 20Hz)
         """
         logger.info("Starting Input Handler")
         self.running = True
 
-        poll_interval = 1.0 / poll_rate
-
         try:
-            while self.running:
-                start_time = time.time()
-
-                # Handle digital inputs
-                self.handle_digital_inputs()
-
-                # Handle encoder
-                self.handle_encoder()
-
-                # Sleep for remaining time to maintain poll rate
-                elapsed = time.time() - start_time
-                sleep_time = max(0, poll_interval - elapsed)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+            if self.controller.has_int_line:
+                self.run_events()
+            else:
+                self.run_polled(poll_rate)
 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
         finally:
+            self.flush_volume()
+            self.squeezelite.close()
             logger.info("Input Handler stopped")
 
     def stop(self):
@@ -289,7 +701,7 @@ class InputHandler:
 
 def signal_handler(signum, frame):
     """Signal handler for graceful shutdown."""
-    logger.info(f"Received signal {signum}")
+    logger.info("Received signal %d", signum)
     sys.exit(0)
 
 
@@ -304,6 +716,24 @@ def main():
         default=20,
         help="Input polling rate in Hz (default: 20)"
     )
+    parser.add_argument(
+        "--int-gpio",
+        type=int,
+        default=None,
+        help="Host GPIO line wired to the RP2040 INT pin (waits for events instead of "
+             "polling; needs gpiod >= 2.0 on Python 3.9+)"
+    )
+    parser.add_argument(
+        "--lms-host",
+        default=SqueezeliteControl.LMS_HOST,
+        help="LMS server for playback commands (default: localhost)"
+    )
+    parser.add_argument(
+        "--player-id",
+        default=None,
+        help="MAC address of the player to control (default: the player "
+             "connected from this host)"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -321,22 +751,23 @@ def main():
 
     # Connect to RP2040
     logger.info("Connecting to RP2040 controller...")
-    controller = RP2040Controller()
+    controller = RP2040Controller(int_gpio=args.int_gpio)
 
     if not controller.open():
         logger.error("Failed to connect to RP2040 controller")
         return 1
 
     version = controller.get_firmware_version()
-    logger.info(f"RP2040 firmware version: {version[0]}.{version[1]}.{version[2]}")
+    logger.info("RP2040 firmware version: %d.%d.%d", *version)
 
     # Create and run input handler
-    handler = InputHandler(controller)
+    handler = InputHandler(controller, lms_host=args.lms_host,
+                           player_id=args.player_id)
 
     try:
         handler.run(poll_rate=args.poll_rate)
     except Exception as e:
-        logger.error(f"Error in input handler: {e}", exc_info=True)
+        logger.error("Error in input handler: %s", e, exc_info=True)
         return 1
     finally:
         controller.close()
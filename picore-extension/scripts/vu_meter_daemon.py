@@ -11,15 +11,22 @@ Based on the VU meter specifications from VUMeters.md:
 - Logarithmic response (dB scale)
 """
 
+import os
 import sys
 import time
 import math
+import select
 import signal
 import logging
 import argparse
-import struct
+import operator
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 try:
     from rp2040_controller import RP2040Controller
@@ -35,6 +42,42 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Supported pipe sample formats:
+# (struct/NumPy type code, bytes per sample, full-scale sample value)
+SAMPLE_FORMATS = {
+    "float32": ("f", 4, 1.0),
+    "s16": ("h", 2, 32768.0),
+}
+
+
+def stereo_power(samples: Sequence[float], scale: float = 1.0) -> Tuple[float, float]:
+    """
+    Compute the mean-square power of both channels in a single pass.
+
+    Args:
+        samples: Interleaved stereo float32 or int16 samples (whole frames),
+                 as a NumPy array or, without NumPy, a cast memoryview
+        scale: Factor normalizing squared samples to full scale (1/full_scale^2)
+
+    Returns:
+        Tuple of (left_power, right_power)
+    """
+    if np is None:
+        # Strided memoryview slices: no per-sample copies or intermediate lists
+        left = samples[0::2]
+        right = samples[1::2]
+        n = len(left)
+        return (sum(map(operator.mul, left, left)) * scale / n,
+                sum(map(operator.mul, right, right)) * scale / n)
+
+    frames = samples.reshape(-1, 2)
+    # Integer samples accumulate exactly in int64
+    acc_dtype = np.int64 if samples.dtype.kind == 'i' else None
+    power = np.einsum('ij,ij->j', frames, frames, dtype=acc_dtype)
+    power = power * (scale / frames.shape[0])
+    return float(power[0]), float(power[1])
+
+
 class VUMeter:
     """
     VU Meter ballistics implementation.
@@ -56,26 +99,42 @@ class VUMeter:
         # Calculate smoothing factor for exponential smoothing
         # alpha = 1 - exp(-1/(fs * tc))
         self.alpha = 1.0 - math.exp(-1.0 / (sample_rate * time_constant))
+        self.one_minus_alpha = 1.0 - self.alpha
         self.vu_state = 0.0
 
-    def process_samples(self, samples: list) -> float:
+    def process_samples(self, samples: Sequence[float]) -> float:
         """
         Process audio samples and return RMS level with VU ballistics.
 
         Args:
-            samples: List of audio sample values
+            samples: Audio sample values (NumPy array or sequence of floats)
 
         Returns:
             RMS level (0.0 to 1.0)
         """
-        if not samples:
+        if len(samples) == 0:
             return 0.0
 
-        # Calculate instantaneous RMS power
-        power = sum(s * s for s in samples) / len(samples)
+        # Calculate instantaneous RMS power (vectorized sum of squares)
+        if np is not None:
+            power = float(np.dot(samples, samples)) / len(samples)
+        else:
+            power = sum(map(operator.mul, samples, samples)) / len(samples)
 
+        return self.process_power(power)
+
+    def process_power(self, power: float) -> float:
+        """
+        Apply VU ballistics to a block's mean-square power.
+
+        Args:
+            power: Mean-square power of the latest block of samples
+
+        Returns:
+            RMS level (0.0 to 1.0)
+        """
         # Apply VU ballistics (exponential smoothing)
-        self.vu_state = self.alpha * power + (1.0 - self.alpha) * self.vu_state
+        self.vu_state = self.alpha * power + self.one_minus_alpha * self.vu_state
 
         # Return RMS value
         return math.sqrt(max(0.0, self.vu_state))
@@ -88,10 +147,18 @@ class VUMeterDaemon:
     Reads audio levels and updates physical VU meters.
     """
 
+    # Number of RMS bins in the dB -> PWM lookup table
+    PWM_LUT_SIZE = 1024
+
+    # Maximum time to block waiting for audio data (seconds)
+    PIPE_POLL_TIMEOUT = 0.1
+
     def __init__(self, pipe_path: str = "/tmp/vu_meter_data",
                  update_rate: int = 50,
                  min_db: float = -20.0,
-                 max_db: float = 3.0):
+                 max_db: float = 3.0,
+                 sample_format: str = "float32",
+                 writer_cpu: Optional[int] = None):
         """
         Initialize VU meter daemon.
 
@@ -100,11 +167,15 @@ class VUMeterDaemon:
             update_rate: Update rate in Hz (default: 50Hz)
             min_db: Minimum dB level for VU meter scale (default: -20 dB)
             max_db: Maximum dB level for VU meter scale (default: +3 dB)
+            sample_format: Pipe sample format, "float32" or "s16" (default: float32)
+            writer_cpu: CPU to pin the I2C writer thread to (default: no affinity)
         """
         self.pipe_path = Path(pipe_path)
         self.update_rate = update_rate
         self.min_db = min_db
         self.max_db = max_db
+        self.sample_format = sample_format
+        self.writer_cpu = writer_cpu
         self.running = False
 
         # Initialize VU meters
@@ -117,6 +188,13 @@ class VUMeterDaemon:
         # Reference level (0 VU = +4 dBu = 1.228V RMS)
         self.reference_voltage = 1.228
 
+        # Precomputed dB -> PWM mapping indexed by quantized RMS level
+        self._pwm_lut = self._build_pwm_lut()
+
+        # Last PWM values sent to the meters and when they were sent
+        self._last_pwm = (-1, -1)
+        self._last_pwm_send = 0.0
+
     def start(self):
         """Start the daemon."""
         logger.info("Starting VU Meter Daemon")
@@ -128,12 +206,16 @@ class VUMeterDaemon:
             return False
 
         version = self.controller.get_firmware_version()
-        logger.info(f"RP2040 firmware version: {version[0]}.{version[1]}.{version[2]}")
+        logger.info("RP2040 firmware version: %d.%d.%d", *version)
 
         # Enable VU meters
         self.controller.enable_vu_meters(True)
         self.controller.set_vu_mode(RP2040Controller.VU_MODE_NORMAL)
 
+        # Write levels from a background thread so audio reads never wait
+        # on the I2C bus
+        self.controller.start_vu_writer(cpu=self.writer_cpu)
+
         self.running = True
         logger.info("VU Meter Daemon started")
 
@@ -188,6 +270,17 @@ class VUMeterDaemon:
         db = 20.0 * math.log10(rms / self.reference_voltage)
         return db
 
+    def _build_pwm_lut(self) -> bytes:
+        """
+        Build the RMS -> PWM lookup table.
+
+        Returns:
+            PWM_LUT_SIZE PWM values for RMS levels evenly spaced over 0.0-1.0
+        """
+        top = self.PWM_LUT_SIZE - 1
+        return bytes(self.scale_db_to_pwm(self.rms_to_db(i / top))
+                     for i in range(self.PWM_LUT_SIZE))
+
     def update_vu_meters(self, left_rms: float, right_rms: float):
         """
         Update physical VU meters.
@@ -196,94 +289,126 @@ class VUMeterDaemon:
             left_rms: Left channel RMS level (0.0 to 1.0)
             right_rms: Right channel RMS level (0.0 to 1.0)
         """
-        # Convert to dB
-        left_db = self.rms_to_db(left_rms)
-        right_db = self.rms_to_db(right_rms)
-
-        # Scale to PWM
-        left_pwm = self.scale_db_to_pwm(left_db)
-        right_pwm = self.scale_db_to_pwm(right_db)
+        # Convert to PWM via the precomputed dB scale
+        lut = self._pwm_lut
+        top = self.PWM_LUT_SIZE - 1
+        left_pwm = lut[min(top, int(left_rms * top))]
+        right_pwm = lut[min(top, int(right_rms * top))]
+
+        # Skip unchanged values and limit writes to the update rate
+        pwm = (left_pwm, right_pwm)
+        now = time.monotonic()
+        if pwm == self._last_pwm or now - self._last_pwm_send < 1.0 / self.update_rate:
+            return
 
         # Update VU meters
         self.controller.set_vu_meters(left_pwm, right_pwm)
+        self._last_pwm = pwm
+        self._last_pwm_send = now
 
     def read_audio_pipe(self):
         """
         Read audio data from named pipe and update VU meters.
 
-        This method expects the pipe to provide stereo float32 audio data.
+        This method expects the pipe to provide interleaved stereo audio
+        data in the configured sample format (float32 or s16).
         """
-        logger.info(f"Opening audio pipe: {self.pipe_path}")
+        logger.info("Opening audio pipe: %s", self.pipe_path)
 
         # Wait for pipe to be created
         retry_count = 0
         while not self.pipe_path.exists() and retry_count < 10:
-            logger.warning(f"Pipe {self.pipe_path} does not exist, waiting...")
+            logger.warning("Pipe %s does not exist, waiting...", self.pipe_path)
             time.sleep(1)
             retry_count += 1
 
         if not self.pipe_path.exists():
-            logger.error(f"Pipe {self.pipe_path} not found after {retry_count} retries")
+            logger.error("Pipe %s not found after %d retries", self.pipe_path, retry_count)
             return
 
+        fd = -1
+        poller = select.epoll()
         try:
-            with open(self.pipe_path, 'rb') as pipe:
-                logger.info("Audio pipe opened, reading data...")
-
-                buffer_size = 4096  # Read 4KB at a time
-                sample_size = 8  # 2 channels * 4 bytes (float32)
-
-                while self.running:
-                    try:
-                        # Read audio data
-                        data = pipe.read(buffer_size)
-                        if not data:
-                            time.sleep(0.001)
-                            continue
-
-                        # Parse stereo float32 samples
-                        num_samples = len(data) // sample_size
-                        samples = struct.unpack(f'{num_samples * 2}f', data[:num_samples * sample_size])
-
-                        # Separate left and right channels
-                        left_samples = [samples[i] for i in range(0, len(samples), 2)]
-                        right_samples = [samples[i] for i in range(1, len(samples), 2)]
-
-                        # Process with VU ballistics
-                        left_rms = self.vu_left.process_samples(left_samples)
-                        right_rms = self.vu_right.process_samples(right_samples)
-
-                        # Update VU meters
-                        self.update_vu_meters(left_rms, right_rms)
-
-                    except struct.error as e:
-                        logger.error(f"Error parsing audio data: {e}")
-                        continue
+            fd = os.open(str(self.pipe_path), os.O_RDONLY | os.O_NONBLOCK)
+            poller.register(fd, select.EPOLLIN)
+            logger.info("Audio pipe opened, reading data...")
+
+            buffer_size = 65536  # Read up to a full pipe buffer at a time
+            type_code, sample_size, full_scale = SAMPLE_FORMATS[self.sample_format]
+            frame_size = 2 * sample_size  # 2 channels per frame
+            power_scale = 1.0 / (full_scale * full_scale)
+            residual = b""  # partial frame carried over between reads
+
+            while self.running:
+                # Sleep until audio data arrives (timeout lets us notice stop())
+                if not poller.poll(self.PIPE_POLL_TIMEOUT):
+                    continue
+
+                # Read audio data
+                try:
+                    data = os.read(fd, buffer_size)
+                except BlockingIOError:
+                    continue
+
+                if not data:
+                    # Writer closed the pipe; reopen so epoll waits for the next
+                    # writer instead of reporting hang-up continuously
+                    poller.unregister(fd)
+                    os.close(fd)
+                    fd = -1
+                    fd = os.open(str(self.pipe_path), os.O_RDONLY | os.O_NONBLOCK)
+                    poller.register(fd, select.EPOLLIN)
+                    residual = b""
+                    continue
+
+                # Process whole frames only, keeping any partial frame so
+                # the channels stay aligned on the next read
+                if residual:
+                    data = residual + data
+                usable = len(data) - len(data) % frame_size
+                residual = data[usable:]
+                if usable == 0:
+                    continue
+
+                # View stereo samples in place (no copy)
+                if np is not None:
+                    samples = np.frombuffer(data, dtype=type_code,
+                                            count=usable // sample_size)
+                else:
+                    samples = memoryview(data)[:usable].cast(type_code)
+
+                # Both channels' power in one pass over the buffer
+                left_power, right_power = stereo_power(samples, power_scale)
+
+                # Process with VU ballistics
+                left_rms = self.vu_left.process_power(left_power)
+                right_rms = self.vu_right.process_power(right_power)
+
+                # Update VU meters
+                self.update_vu_meters(left_rms, right_rms)
 
         except FileNotFoundError:
-            logger.error(f"Pipe {self.pipe_path} not found")
+            logger.error("Pipe %s not found", self.pipe_path)
         except BrokenPipeError:
             logger.warning("Pipe closed, retrying...")
             time.sleep(1)
         except Exception as e:
-            logger.error(f"Error reading from pipe: {e}")
+            logger.error("Error reading from pipe: %s", e)
+        finally:
+            poller.close()
+            if fd >= 0:
+                os.close(fd)
 
     def run_test_mode(self):
         """Run in test mode with generated sweep pattern."""
         logger.info("Running in test mode")
 
         try:
-            # Sweep up
-            for i in range(256):
-                level = i
-                self.controller.set_vu_meters(level, level)
-                time.sleep(0.01)
-
-            # Sweep down
-            for i in range(255, -1, -1):
-                level = i
-                self.controller.set_vu_meters(level, level)
-                time.sleep(0.01)
+            # Sweep up, then down; the controller times each ramp
+            self.controller.set_vu_sweep(0, 255, 10)
+            time.sleep(2.56)
+            self.controller.set_vu_sweep(255, 0, 10)
+            time.sleep(2.56)
 
             # Turn off
             self.controller.set_vu_meters(0, 0)
@@ -310,7 +435,7 @@ class VUMeterDaemon:
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
         except Exception as e:
-            logger.error(f"Error in main loop: {e}", exc_info=True)
+            logger.error("Error in main loop: %s", e, exc_info=True)
         finally:
             self.stop()
 
@@ -319,7 +444,7 @@ class VUMeterDaemon:
 
 def signal_handler(signum, frame):
     """Signal handler for graceful shutdown."""
-    logger.info(f"Received signal {signum}")
+    logger.info("Received signal %d", signum)
     sys.exit(0)
 
 
@@ -349,6 +474,19 @@ def main():
         default=3.0,
         help="Maximum dB level for VU scale (default: +3)"
     )
+    parser.add_argument(
+        "--format",
+        choices=sorted(SAMPLE_FORMATS),
+        default="float32",
+        help="Pipe sample format: float32 or s16 (16-bit PCM, half the bandwidth) "
+             "(default: float32)"
+    )
+    parser.add_argument(
+        "--writer-cpu",
+        type=int,
+        default=None,
+        help="CPU to pin the I2C writer thread to (default: no affinity)"
+    )
     parser.add_argument(
         "--test",
         action="store_true",
@@ -374,7 +512,9 @@ def main():
         pipe_path=args.pipe,
         update_rate=args.rate,
         min_db=args.min_db,
-        max_db=args.max_db
+        max_db=args.max_db,
+        sample_format=args.format,
+        writer_cpu=args.writer_cpu
     )
 
     return daemon.run(test_mode=args.test)
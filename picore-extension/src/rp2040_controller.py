@@ -8,13 +8,53 @@ controller via I2C for VU meters, backlight, tape motor, and digital inputs.
 """
 
 import logging
-from typing import List, Tuple, Optional
+import os
+import queue
+import struct
+import threading
+from typing import Iterator, List, NamedTuple, Tuple, Optional
 from smbus2 import SMBus, i2c_msg
 import time
 
+# Optional INT line support: libgpiod v2 bindings (gpiod >= 2.0, Python 3.9+)
+try:
+    import gpiod
+    from gpiod.line import Bias, Edge, Value
+except ImportError:
+    gpiod = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Per-byte bit tables for unpacking input bitmasks into booleans (bit 0 first)
+_BITS8 = [tuple((b >> i) & 1 != 0 for i in range(8)) for b in range(256)]
+_BITS4 = [bits[:4] for bits in _BITS8[:16]]
+
+# Registers used on the VU and input polling paths. Hot methods read these
+# module globals (LOAD_GLOBAL) rather than looking them up through self;
+# the RP2040Controller constants of the same name alias them.
+_REG_STATUS = 0x11
+_REG_VU_LEFT = 0x20
+_REG_INPUT_STATUS_LOW = 0x50
+
+# Little-endian register layouts
+_U16 = struct.Struct("<H")
+_S16 = struct.Struct("<h")
+# 0x50-0x63: input status, input changed, reserved 0x54-0x5F,
+# encoder position (signed), encoder delta (signed), encoder button
+_INPUT_BLOCK = struct.Struct("<HH12xhbB")
+
+
+class ControllerState(NamedTuple):
+    """Controller status, inputs and encoder state read by poll()."""
+    status: int            # STATUS_* bits
+    error: int             # ERROR_* bits
+    inputs: int            # 12-bit mask, set = pressed/active
+    changes: int           # 12-bit mask, set = changed since last read
+    encoder_position: int  # Signed position in detents
+    encoder_delta: int     # Signed detents since last read
+    encoder_button: int    # ENC_BTN_* state
+
 
 class RP2040Controller:
     """
@@ -27,6 +67,19 @@ class RP2040Controller:
     # I2C Configuration
     DEFAULT_BUS = 1
     DEFAULT_ADDRESS = 0x42
+    DEFAULT_GPIO_CHIP = "/dev/gpiochip0"
+
+    # Device tree clock for the host I2C adapter (32-bit big-endian cell)
+    SYSFS_BUS_CLOCK = "/sys/bus/i2c/devices/i2c-{bus}/of_node/clock-frequency"
+    FAST_MODE_CLOCK = 400000
+
+    # Soft reset readiness polling (seconds)
+    RESET_TIMEOUT = 0.1
+    RESET_POLL_INTERVAL = 0.002
+
+    # Encoder direction reversals closer together than this are treated as
+    # contact bounce and dropped (seconds)
+    MIN_REVERSAL_INTERVAL = 0.002
 
     # Device Information Registers
     REG_DEVICE_ID = 0x00
@@ -36,13 +89,16 @@ class RP2040Controller:
 
     # Control and Status Registers
     REG_CONTROL = 0x10
-    REG_STATUS = 0x11
+    REG_STATUS = _REG_STATUS
     REG_ERROR = 0x12
 
     # VU Meter Registers
-    REG_VU_LEFT = 0x20
+    REG_VU_LEFT = _REG_VU_LEFT
     REG_VU_RIGHT = 0x21
     REG_VU_MODE = 0x22
+    REG_VU_SWEEP_START = 0x23
+    REG_VU_SWEEP_END = 0x24
+    REG_VU_SWEEP_STEP_MS = 0x25
 
     # Backlight Registers
     REG_BACKLIGHT = 0x30
@@ -54,7 +110,7 @@ class RP2040Controller:
     REG_TAPE_MODE = 0x42
 
     # Digital Input Registers
-    REG_INPUT_STATUS_LOW = 0x50
+    REG_INPUT_STATUS_LOW = _REG_INPUT_STATUS_LOW
     REG_INPUT_STATUS_HIGH = 0x51
     REG_INPUT_CHANGED_LOW = 0x52
     REG_INPUT_CHANGED_HIGH = 0x53
@@ -69,6 +125,7 @@ class RP2040Controller:
     REG_CONFIG_VU_FREQ = 0x70
     REG_CONFIG_DEBOUNCE = 0x71
     REG_CONFIG_OPTIONS = 0x72
+    REG_CONFIG_ENCODER_DIV = 0x73
 
     # Command Register
     REG_COMMAND = 0xF0
@@ -129,22 +186,58 @@ class RP2040Controller:
     CMD_TEST_VU_LEFT = 0x11
     CMD_TEST_VU_RIGHT = 0x12
     CMD_TEST_VU_BOTH = 0x13
+    CMD_VU_SWEEP = 0x14
     CMD_TEST_BACKLIGHT = 0x20
     CMD_TEST_TAPE_MOTOR = 0x30
     CMD_TEST_ALL = 0xFF
 
-    def __init__(self, bus: int = DEFAULT_BUS, address: int = DEFAULT_ADDRESS):
+    COMMANDS = (CMD_NOP, CMD_RESET, CMD_FACTORY_RESET, CMD_TEST_VU_LEFT,
+                CMD_TEST_VU_RIGHT, CMD_TEST_VU_BOTH, CMD_VU_SWEEP,
+                CMD_TEST_BACKLIGHT, CMD_TEST_TAPE_MOTOR, CMD_TEST_ALL)
+
+    def __init__(self, bus: int = DEFAULT_BUS, address: int = DEFAULT_ADDRESS,
+                 int_gpio: Optional[int] = None, int_chip: str = DEFAULT_GPIO_CHIP):
         """
         Initialize RP2040 controller interface.
 
         Args:
             bus: I2C bus number (default: 1)
             address: I2C slave address (default: 0x42)
+            int_gpio: Host GPIO line wired to the controller's INT pin, or
+                None to poll without it
+            int_chip: GPIO chip device for int_gpio
         """
         self.bus_num = bus
         self.address = address
         self.bus = None
+        self.int_gpio = int_gpio
+        self.int_chip = int_chip
+        self._int_request = None
         self._last_encoder_pos = 0
+        # Direction and time of the last accepted encoder delta
+        self._last_delta_sign = 0
+        self._last_delta_time = 0.0
+
+        # Background VU writer (see start_vu_writer)
+        self._vu_queue = None
+        self._vu_thread = None
+
+        # Last value written to REG_CONTROL, so enable/disable calls need no
+        # read-back; loaded from the device in open() and after reset()
+        self._control_shadow = 0
+
+        # Prebuilt command register writes, one per known command
+        self._command_msgs = {
+            cmd: i2c_msg.write(address, [self.REG_COMMAND, cmd])
+            for cmd in self.COMMANDS
+        }
+
+        # Prebuilt messages for poll() and get_input_snapshot(); the read
+        # buffers are reused and copied out after each transfer
+        self._status_w = i2c_msg.write(address, [_REG_STATUS])
+        self._status_r = i2c_msg.read(address, 2)
+        self._block_w = i2c_msg.write(address, [_REG_INPUT_STATUS_LOW])
+        self._block_r = i2c_msg.read(address, _INPUT_BLOCK.size)
 
     def open(self) -> bool:
         """
@@ -163,15 +256,55 @@ class RP2040Controller:
                 logger.error(f"Invalid device ID: 0x{device_id:02X} (expected 0x52)")
                 return False
 
+            self._control_shadow = self.read_register(self.REG_CONTROL)
+
             logger.info("RP2040 controller detected")
+            self._log_bus_clock()
+
+            if self.int_gpio is not None:
+                self._open_int_line()
             return True
 
         except Exception as e:
             logger.error(f"Failed to open I2C bus: {e}")
             return False
 
+    def _log_bus_clock(self):
+        """Log the host I2C bus clock, if the device tree exposes it."""
+        try:
+            with open(self.SYSFS_BUS_CLOCK.format(bus=self.bus_num), "rb") as f:
+                clock = int.from_bytes(f.read(4), "big")
+        except OSError:
+            return
+
+        logger.info(f"I2C bus {self.bus_num} clock: {clock // 1000} kHz")
+        if clock < self.FAST_MODE_CLOCK:
+            logger.info("Set dtparam=i2c_arm_baudrate=400000 in config.txt "
+                        "for 400 kHz fast mode")
+
+    def _open_int_line(self):
+        """Request the INT GPIO line for falling-edge events."""
+        if gpiod is None:
+            logger.warning("gpiod not available, INT line disabled")
+            return
+
+        try:
+            self._int_request = gpiod.request_lines(
+                self.int_chip,
+                consumer="rp2040-int",
+                config={self.int_gpio: gpiod.LineSettings(
+                    edge_detection=Edge.FALLING, bias=Bias.PULL_UP)},
+            )
+            logger.info(f"Using GPIO {self.int_gpio} on {self.int_chip} as INT line")
+        except OSError as e:
+            logger.warning(f"Failed to request INT line GPIO {self.int_gpio}: {e}")
+
     def close(self):
         """Close I2C bus connection."""
+        self.stop_vu_writer()
+        if self._int_request:
+            self._int_request.release()
+            self._int_request = None
         if self.bus:
             self.bus.close()
             logger.info("Closed I2C bus")
@@ -201,6 +334,30 @@ class RP2040Controller:
             logger.error(f"Failed to read register 0x{reg:02X}: {e}")
             raise
 
+    def _read_block(self, reg: int, count: int) -> bytes:
+        """
+        Read consecutive registers in a single I2C transaction.
+
+        Sends the register address and reads the data back as one combined
+        write-then-read transfer (repeated start, no STOP in between).
+
+        Args:
+            reg: First register address
+            count: Number of registers to read
+
+        Returns:
+            Register values (0-255)
+        """
+        address = self.address
+        write = i2c_msg.write(address, [reg])
+        read = i2c_msg.read(address, count)
+        try:
+            self.bus.i2c_rdwr(write, read)
+        except Exception as e:
+            logger.error(f"Failed to read registers 0x{reg:02X}+{count}: {e}")
+            raise
+        return bytes(read)
+
     def write_register(self, reg: int, value: int):
         """
         Write a single register.
@@ -215,6 +372,20 @@ class RP2040Controller:
             logger.error(f"Failed to write register 0x{reg:02X}: {e}")
             raise
 
+    def _write_block(self, reg: int, values: List[int]):
+        """
+        Write consecutive registers in a single I2C transaction.
+
+        Args:
+            reg: First register address
+            values: Values to write (0-255 each)
+        """
+        try:
+            self.bus.write_i2c_block_data(self.address, reg, values)
+        except Exception as e:
+            logger.error(f"Failed to write registers 0x{reg:02X}+{len(values)}: {e}")
+            raise
+
     def get_firmware_version(self) -> Tuple[int, int, int]:
         """
         Get firmware version.
@@ -222,9 +393,7 @@ class RP2040Controller:
         Returns:
             Tuple of (major, minor, patch)
         """
-        major = self.read_register(self.REG_FIRMWARE_VER_MAJ)
-        minor = self.read_register(self.REG_FIRMWARE_VER_MIN)
-        patch = self.read_register(self.REG_FIRMWARE_VER_PATCH)
+        major, minor, patch = self._read_block(self.REG_FIRMWARE_VER_MAJ, 3)
         return (major, minor, patch)
 
     def get_status(self) -> int:
@@ -278,9 +447,91 @@ class RP2040Controller:
         Args:
             left: Left VU level (0-255)
             right: Right VU level (0-255)
+
+        Note: With the VU writer running this only queues the levels,
+        replacing any not yet written, and returns immediately
         """
-        self.set_vu_left(left)
-        self.set_vu_right(right)
+        levels = [left & 0xFF, right & 0xFF]
+
+        vu_queue = self._vu_queue
+        if vu_queue is not None:
+            # Last write wins: drop a pending update the writer hasn't taken
+            try:
+                vu_queue.get_nowait()
+            except queue.Empty:
+                pass
+            vu_queue.put_nowait(levels)
+            return
+
+        # VU_LEFT and VU_RIGHT are consecutive, so write both in one transaction
+        self._write_block(_REG_VU_LEFT, levels)
+
+    def start_vu_writer(self, cpu: Optional[int] = None):
+        """
+        Move set_vu_meters() bus writes to a background thread.
+
+        Callers producing levels at audio rate then never wait on the bus;
+        only the latest pending levels are written.
+
+        Args:
+            cpu: CPU to pin the writer thread to, or None for no affinity
+        """
+        if self._vu_thread is not None:
+            return
+
+        self._vu_queue = queue.Queue(maxsize=1)
+        self._vu_thread = threading.Thread(
+            target=self._vu_writer, args=(self._vu_queue, cpu),
+            name="vu-writer", daemon=True)
+        self._vu_thread.start()
+
+    def stop_vu_writer(self):
+        """Write any pending VU levels and stop the background writer."""
+        if self._vu_thread is None:
+            return
+
+        vu_queue = self._vu_queue
+        self._vu_queue = None
+        # Blocks until the writer has taken the pending levels, if any
+        vu_queue.put(None)
+        self._vu_thread.join(timeout=1.0)
+        self._vu_thread = None
+
+    def _vu_writer(self, vu_queue: queue.Queue, cpu: Optional[int]):
+        """Background thread body for start_vu_writer()."""
+        if cpu is not None:
+            try:
+                os.sched_setaffinity(0, {cpu})
+            except (AttributeError, OSError) as e:
+                logger.warning(f"Failed to pin VU writer to CPU {cpu}: {e}")
+
+        get = vu_queue.get
+        write_block = self._write_block
+        while True:
+            levels = get()
+            if levels is None:
+                break
+            try:
+                write_block(_REG_VU_LEFT, levels)
+            except Exception:
+                # Already logged; keep the writer alive for the next update
+                pass
+
+    def set_vu_sweep(self, start: int, stop: int, step_ms: int):
+        """
+        Ramp both VU meters from start to stop, timed by the controller.
+
+        The sweep runs on the RP2040 after this returns; a direct VU level
+        write cancels it.
+
+        Args:
+            start: Starting VU level (0-255)
+            stop: Final VU level (0-255)
+            step_ms: Time per level step in milliseconds (0-255)
+        """
+        self._write_block(self.REG_VU_SWEEP_START,
+                          [start & 0xFF, stop & 0xFF, max(0, min(255, step_ms))])
+        self.send_command(self.CMD_VU_SWEEP)
 
     def set_vu_mode(self, mode: int):
         """
@@ -298,12 +549,11 @@ class RP2040Controller:
         Args:
             enable: True to enable, False to disable
         """
-        control = self.read_register(self.REG_CONTROL)
         if enable:
-            control |= self.CTRL_VU_ENABLE
+            self._control_shadow |= self.CTRL_VU_ENABLE
         else:
-            control &= ~self.CTRL_VU_ENABLE
-        self.write_register(self.REG_CONTROL, control)
+            self._control_shadow &= ~self.CTRL_VU_ENABLE
+        self.write_register(self.REG_CONTROL, self._control_shadow)
 
     # ========================================================================
     # Backlight Control
@@ -334,12 +584,11 @@ class RP2040Controller:
         Args:
             enable: True to enable, False to disable
         """
-        control = self.read_register(self.REG_CONTROL)
         if enable:
-            control |= self.CTRL_BACKLIGHT_ENABLE
+            self._control_shadow |= self.CTRL_BACKLIGHT_ENABLE
         else:
-            control &= ~self.CTRL_BACKLIGHT_ENABLE
-        self.write_register(self.REG_CONTROL, control)
+            self._control_shadow &= ~self.CTRL_BACKLIGHT_ENABLE
+        self.write_register(self.REG_CONTROL, self._control_shadow)
 
     # ========================================================================
     # Tape Motor Control
@@ -353,8 +602,9 @@ class RP2040Controller:
             speed: Motor speed (0-255)
             direction: Motor direction (TAPE_DIR_STOP, TAPE_DIR_FORWARD, TAPE_DIR_REVERSE)
         """
-        self.write_register(self.REG_TAPE_SPEED, speed)
-        self.write_register(self.REG_TAPE_DIRECTION, direction)
+        # Write speed and direction together so the motor never sees a
+        # new direction with the old speed
+        self._write_block(self.REG_TAPE_SPEED, [speed & 0xFF, direction & 0xFF])
 
     def stop_tape_motor(self, brake: bool = False):
         """
@@ -363,9 +613,8 @@ class RP2040Controller:
         Args:
             brake: If True, use active brake; if False, coast to stop
         """
-        self.write_register(self.REG_TAPE_SPEED, 0)
         direction = self.TAPE_DIR_BRAKE if brake else self.TAPE_DIR_STOP
-        self.write_register(self.REG_TAPE_DIRECTION, direction)
+        self._write_block(self.REG_TAPE_SPEED, [0, direction])
 
     def enable_tape_motor(self, enable: bool = True):
         """
@@ -374,12 +623,11 @@ class RP2040Controller:
         Args:
             enable: True to enable, False to disable
         """
-        control = self.read_register(self.REG_CONTROL)
         if enable:
-            control |= self.CTRL_TAPE_ENABLE
+            self._control_shadow |= self.CTRL_TAPE_ENABLE
         else:
-            control &= ~self.CTRL_TAPE_ENABLE
-        self.write_register(self.REG_CONTROL, control)
+            self._control_shadow &= ~self.CTRL_TAPE_ENABLE
+        self.write_register(self.REG_CONTROL, self._control_shadow)
 
     # ========================================================================
     # Digital Inputs
@@ -392,17 +640,8 @@ class RP2040Controller:
         Returns:
             List of 12 booleans (True = pressed/active, False = released/inactive)
         """
-        status_low = self.read_register(self.REG_INPUT_STATUS_LOW)
-        status_high = self.read_register(self.REG_INPUT_STATUS_HIGH)
-
-        inputs = []
-        # Inputs are active low, so invert the logic
-        for i in range(8):
-            inputs.append((status_low & (1 << i)) == 0)
-        for i in range(4):
-            inputs.append((status_high & (1 << i)) == 0)
-
-        return inputs
+        inputs = self.get_digital_inputs_bits()
+        return list(_BITS8[inputs & 0xFF] + _BITS4[inputs >> 8])
 
     def get_input_changes(self) -> List[bool]:
         """
@@ -413,21 +652,38 @@ class RP2040Controller:
 
         Note: Reading this register clears the change flags
         """
-        changed_low = self.read_register(self.REG_INPUT_CHANGED_LOW)
-        changed_high = self.read_register(self.REG_INPUT_CHANGED_HIGH)
+        changes = self.get_input_changes_bits()
+        return list(_BITS8[changes & 0xFF] + _BITS4[changes >> 8])
 
-        changes = []
-        for i in range(8):
-            changes.append((changed_low & (1 << i)) != 0)
-        for i in range(4):
-            changes.append((changed_high & (1 << i)) != 0)
+    def get_digital_inputs_bits(self) -> int:
+        """
+        Read all digital input states as a bitmask.
 
-        return changes
+        Returns:
+            12-bit mask (bit 0 = input 1, set = pressed/active)
+        """
+        status, = _U16.unpack(self._read_block(self.REG_INPUT_STATUS_LOW, 2))
+
+        # Inputs are active low, so invert the logic
+        return ~status & 0x0FFF
+
+    def get_input_changes_bits(self) -> int:
+        """
+        Read input change flags as a bitmask.
+
+        Returns:
+            12-bit mask (bit 0 = input 1, set = changed since last read)
+
+        Note: Reading this register clears the change flags
+        """
+        changed, = _U16.unpack(self._read_block(self.REG_INPUT_CHANGED_LOW, 2))
+
+        return changed & 0x0FFF
 
     def clear_input_changes(self):
         """Clear all input change flags."""
-        control = self.read_register(self.REG_CONTROL)
-        self.write_register(self.REG_CONTROL, control | self.CTRL_CLEAR_INPUTS)
+        # The firmware clears this bit itself, so keep it out of the shadow
+        self.write_register(self.REG_CONTROL, self._control_shadow | self.CTRL_CLEAR_INPUTS)
 
     # ========================================================================
     # Rotary Encoder
@@ -438,16 +694,9 @@ class RP2040Controller:
         Read encoder position.
 
         Returns:
-            16-bit signed encoder position (-32768 to 32767)
+            16-bit signed encoder position in detents (-32768 to 32767)
         """
-        low = self.read_register(self.REG_ENCODER_POS_LOW)
-        high = self.read_register(self.REG_ENCODER_POS_HIGH)
-
-        pos = (high << 8) | low
-        # Convert to signed 16-bit
-        if pos > 32767:
-            pos -= 65536
-
+        pos, = _S16.unpack(self._read_block(self.REG_ENCODER_POS_LOW, 2))
         return pos
 
     def get_encoder_delta(self) -> int:
@@ -455,15 +704,38 @@ class RP2040Controller:
         Read encoder delta since last read.
 
         Returns:
-            8-bit signed delta (-128 to 127)
+            8-bit signed delta in detents (-128 to 127); 0 if the delta
+            reverses direction within MIN_REVERSAL_INTERVAL of the last one
 
         Note: Reading this register clears the delta
         """
         delta = self.read_register(self.REG_ENCODER_DELTA)
-        # Convert to signed 8-bit
-        if delta > 127:
-            delta -= 256
+        # Sign-extend 8-bit two's complement without a branch
+        return self._filter_delta((delta ^ 0x80) - 0x80)
+
+    def _filter_delta(self, delta: int) -> int:
+        """
+        Reject encoder deltas that reverse direction implausibly fast.
+
+        Args:
+            delta: Signed delta as read from the controller
+
+        Returns:
+            delta, or 0 if it reverses the last accepted direction within
+            MIN_REVERSAL_INTERVAL
+        """
+        if not delta:
+            return 0
+
+        now = time.monotonic()
+        sign = 1 if delta > 0 else -1
+        if (sign != self._last_delta_sign and
+                now - self._last_delta_time < self.MIN_REVERSAL_INTERVAL):
+            logger.debug("Dropped encoder reversal: %d", delta)
+            return 0
 
+        self._last_delta_sign = sign
+        self._last_delta_time = now
         return delta
 
     def get_encoder_button(self) -> int:
@@ -477,8 +749,138 @@ class RP2040Controller:
 
     def reset_encoder(self):
         """Reset encoder position to zero."""
-        control = self.read_register(self.REG_CONTROL)
-        self.write_register(self.REG_CONTROL, control | self.CTRL_RESET_ENCODER)
+        # The firmware clears this bit itself, so keep it out of the shadow
+        self.write_register(self.REG_CONTROL, self._control_shadow | self.CTRL_RESET_ENCODER)
+
+    def set_encoder_divisor(self, steps: int):
+        """
+        Set the number of quadrature steps counted as one encoder detent.
+
+        Args:
+            steps: Quadrature steps per detent (1-255, default 4)
+        """
+        self.write_register(self.REG_CONFIG_ENCODER_DIV, max(1, min(255, steps)))
+
+    # ========================================================================
+    # Combined Reads
+    # ========================================================================
+
+    def get_input_snapshot(self) -> Tuple[int, int, int, int]:
+        """
+        Read digital inputs and encoder state in a single I2C transaction.
+
+        Returns:
+            Tuple of (changes, inputs, encoder_delta, encoder_button), where
+            changes and inputs are 12-bit masks as returned by
+            get_input_changes_bits() and get_digital_inputs_bits()
+
+        Note: Reading clears the input change flags and encoder delta
+        """
+        block_r = self._block_r
+        try:
+            self.bus.i2c_rdwr(self._block_w, block_r)
+        except Exception as e:
+            logger.error(f"Failed to read input snapshot: {e}")
+            raise
+
+        status, changed, _, delta, button = _INPUT_BLOCK.unpack(bytes(block_r))
+
+        # Inputs are active low, so invert the logic
+        return (changed & 0x0FFF, ~status & 0x0FFF, self._filter_delta(delta), button)
+
+    def poll(self) -> ControllerState:
+        """
+        Read status, error, inputs and encoder state in one I2C transfer.
+
+        The status/error pair and the input/encoder block are read as two
+        segments of a single combined transaction.
+
+        Returns:
+            ControllerState with all fields decoded
+
+        Note: Reading clears the input change flags and encoder delta
+        """
+        status_r = self._status_r
+        block_r = self._block_r
+        try:
+            self.bus.i2c_rdwr(self._status_w, status_r, self._block_w, block_r)
+        except Exception as e:
+            logger.error(f"Failed to poll controller: {e}")
+            raise
+
+        status, error = bytes(status_r)
+        inputs, changed, pos, delta, button = _INPUT_BLOCK.unpack(bytes(block_r))
+
+        # Inputs are active low, so invert the logic
+        return ControllerState(status, error, ~inputs & 0x0FFF, changed & 0x0FFF,
+                               pos, self._filter_delta(delta), button)
+
+    # ========================================================================
+    # Event Wait
+    # ========================================================================
+
+    @property
+    def has_int_line(self) -> bool:
+        """True if events are signalled on the INT line."""
+        return self._int_request is not None
+
+    def wait_for_event(self, timeout: float) -> Optional[ControllerState]:
+        """
+        Wait for an input, encoder or button event and read the new state.
+
+        With an INT line, blocks until the controller asserts it and then
+        reads the state with poll(). Without one, sleeps for the timeout
+        and polls.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            ControllerState, or None if the timeout expired with no event
+        """
+        request = self._int_request
+        if request is None:
+            time.sleep(timeout)
+            return self.poll()
+
+        # An event may have arrived while the last poll() was in flight, in
+        # which case the line is already low and no new edge will come
+        if request.get_value(self.int_gpio) == Value.ACTIVE:
+            if not request.wait_edge_events(timeout):
+                return None
+
+        # Discard queued edges; poll() picks up everything they signalled
+        while request.wait_edge_events(0):
+            request.read_edge_events()
+
+        return self.poll()
+
+    def iter_events(self, period: float) -> Iterator[ControllerState]:
+        """
+        Poll the controller at a fixed period and yield each state.
+
+        Polls reuse poll()'s preallocated messages and run on a monotonic
+        schedule, so the rate does not drift with processing time.
+
+        Args:
+            period: Time between polls in seconds
+
+        Yields:
+            ControllerState for each poll
+        """
+        poll = self.poll
+        next_poll = time.monotonic()
+        while True:
+            yield poll()
+
+            next_poll += period
+            delay = next_poll - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -period:
+                # Fell behind by more than a period: resync, don't burst
+                next_poll = time.monotonic() + period
+                time.sleep(period)
 
     # ========================================================================
     # Commands
@@ -491,12 +893,36 @@ class RP2040Controller:
         Args:
             command: Command code (CMD_*)
         """
-        self.write_register(self.REG_COMMAND, command)
+        msg = self._command_msgs.get(command)
+        if msg is None:
+            self.write_register(self.REG_COMMAND, command)
+            return
+
+        try:
+            self.bus.i2c_rdwr(msg)
+        except Exception as e:
+            logger.error(f"Failed to send command 0x{command:02X}: {e}")
+            raise
 
     def reset(self):
         """Soft reset the controller."""
         self.send_command(self.CMD_RESET)
-        time.sleep(0.1)  # Wait for reset
+
+        # Wait until the controller reports ready; it may not respond on
+        # the bus for a moment, so ignore errors until the deadline
+        deadline = time.monotonic() + self.RESET_TIMEOUT
+        while True:
+            try:
+                if self.bus.read_byte_data(self.address, self.REG_STATUS) & self.STATUS_READY:
+                    break
+            except OSError:
+                pass
+            if time.monotonic() >= deadline:
+                logger.warning("Controller not ready after reset")
+                break
+            time.sleep(self.RESET_POLL_INTERVAL)
+
+        self._control_shadow = self.read_register(self.REG_CONTROL)
 
     def test_vu_meters(self, which: str = "both"):
         """
@@ -541,15 +967,18 @@ if __name__ == "__main__":
             # Set backlight to 50%
             controller.set_backlight(128)
 
-            # Sweep VU meters
+            # Sweep VU meters: one prebuilt block write per frame, on a
+            # fixed schedule so sleep overshoot does not accumulate
             print("\nSweeping VU meters...")
-            for level in range(0, 256, 10):
-                controller.set_vu_meters(level, level)
-                time.sleep(0.05)
-
-            for level in range(255, -1, -10):
-                controller.set_vu_meters(level, level)
-                time.sleep(0.05)
+            levels = list(range(0, 256, 10)) + list(range(255, -1, -10))
+            frames = [i2c_msg.write(controller.address,
+                                    [RP2040Controller.REG_VU_LEFT, level, level])
+                      for level in levels]
+            next_frame = time.monotonic()
+            for frame in frames:
+                controller.bus.i2c_rdwr(frame)
+                next_frame += 0.05
+                time.sleep(max(0.0, next_frame - time.monotonic()))
 
             # Read inputs
             print("\nReading digital inputs...")